@@ -1,9 +1,61 @@
+import asyncio
 from web3 import Web3
+from eth_abi import decode as abi_decode, encode as abi_encode
 from typing import List, Tuple, Dict, Union
 from datetime import datetime
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
+import gzip
+import heapq
+import json
+import random
 import requests
+import threading
 import time
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+from config import (
+    ALTERNATIVE_RPC_URLS,
+    API_RATE_LIMIT,
+    CACHE_LIFETIME,
+    HEALTHCHECK_INTERVAL,
+    MAX_BATCH_SIZE,
+    MAX_CACHE_SIZE,
+    MAX_CONCURRENCY,
+    NEGATIVE_CACHE_LIFETIME,
+    REDIS_URL,
+    REQUEST_TIMEOUT,
+)
 
 # Инициализация подключения к Polygon
 POLYGON_RPC_URL = "https://polygon-rpc.com"
@@ -49,51 +101,404 @@ ERC20_ABI = [
     }
 ]
 
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Основная нода плюс запасные из config.py - публичные RPC регулярно деградируют
+RPC_URLS = [POLYGON_RPC_URL] + ALTERNATIVE_RPC_URLS
+
+# Multicall3, задеплоен по одному адресу во всех основных сетях, включая Polygon
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# Размер чанка подобран так, чтобы не упираться в лимит газа eth_call на публичных нодах
+MULTICALL_CHUNK_SIZE = 500
+
+# Максимум строк в накопленной истории транзакций и период полного обновления
+TX_WINDOW = 5000
+TX_FULL_REFRESH_INTERVAL = 3600
+
+class RateLimiter:
+    """Простейший token bucket, равномерно распределяющий вызовы между потоками"""
+    def __init__(self, rate: float, per: float = 1.0):
+        self._interval = per / rate
+        self._lock = threading.Lock()
+        self._next_call = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_call:
+                wait = self._next_call - now
+                self._next_call += self._interval
+            else:
+                wait = 0.0
+                self._next_call = now + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+# Бесплатный тариф Etherscan: не больше API_RATE_LIMIT запросов в секунду
+_etherscan_limiter = RateLimiter(API_RATE_LIMIT)
+
+# to_checksum_address считает keccak256 при каждом вызове - мемоизируем результат,
+# заодно кэш балансов получает единый канонический вид ключа
+_to_checksum = lru_cache(maxsize=100_000)(Web3.to_checksum_address)
+
+# Селектор balanceOf(address) считается один раз на импорт модуля; сборка calldata
+# напрямую через eth_abi обходит накладные расходы ContractFunction на горячем пути
+BALANCE_OF_SELECTOR = Web3.keccak(text='balanceOf(address)')[:4]
+
+def _balance_of_calldata(address: str) -> bytes:
+    return BALANCE_OF_SELECTOR + abi_encode(['address'], [address])
+
+# С какого числа держателей векторный отбор через NumPy обгоняет heapq
+NUMPY_TOPN_THRESHOLD = 2000
+
+def _top_n_by_balance(rows: list, n: int) -> list:
+    """Отбор n строк с наибольшим балансом (элемент с индексом 1), по убыванию"""
+    if np is not None and len(rows) >= NUMPY_TOPN_THRESHOLD:
+        balances = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+        n = min(n, len(rows))
+        idx = np.argpartition(-balances, n - 1)[:n]
+        idx = idx[np.argsort(-balances[idx])]
+        return [rows[i] for i in idx]
+    return heapq.nlargest(n, rows, key=itemgetter(1))
+
 class TokenTracker:
     def __init__(self):
-        self.w3 = Web3(Web3.HTTPProvider(POLYGON_RPC_URL))
+        # Общая сессия с keep-alive: TLS-рукопожатие делается один раз на соединение
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+        self._rpc_lock = threading.Lock()
+        self._rpc_url = self._pick_fastest_rpc()
+        self._last_rpc_check = time.time()
+        self._connect(self._rpc_url)
+        self.decimals = self.contract.functions.decimals().call()
+        self._scale = 10 ** self.decimals
+        # Ограниченный кэш балансов: TTL на запись плюс вытеснение старых записей,
+        # чтобы перебор случайных адресов не раздувал память без предела
+        self._balance_cache = TTLCache(maxsize=MAX_CACHE_SIZE, ttl=CACHE_LIFETIME)
+        self._cache_lock = threading.Lock()
+        # Single-flight: адреса, которые прямо сейчас запрашивает другой поток
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._tx_lock = threading.Lock()
+        self._info_lock = threading.Lock()
+        self._tx_cache = None
+        # Последний принятый ответ Etherscan и его (число строк, максимальный блок)
+        self._tx_last_good = None
+        self._tx_high_water = (0, 0)
+        self._tx_last_full_refresh = 0.0
+        self._token_info_cache = None
+        self._redis = None
+        if REDIS_URL and redis is not None:
+            try:
+                self._redis = redis.Redis.from_url(REDIS_URL)
+                self._redis.ping()
+            except Exception as e:
+                print(f"Redis unavailable, using in-process cache: {e}")
+                self._redis = None
+
+    def _connect(self, rpc_url: str):
+        self.w3 = Web3(Web3.HTTPProvider(rpc_url, session=self._session))
         self.contract = self.w3.eth.contract(
             address=self.w3.to_checksum_address(CONTRACT_ADDRESS),
             abi=ERC20_ABI
         )
-        self.decimals = self.contract.functions.decimals().call()
-        self._balance_cache = {}
-        self._tx_cache = {}
-        self._token_info_cache = None
-        self._cache_lifetime = 300
-        self._last_cache_update = 0
+        self.multicall = self.w3.eth.contract(
+            address=self.w3.to_checksum_address(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+
+    def _ping_rpc(self, url: str) -> str:
+        payload = {"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 1}
+        response = self._session.post(url, json=payload, timeout=5)
+        response.raise_for_status()
+        if 'result' not in response.json():
+            raise ValueError(f"Bad RPC response from {url}")
+        return url
+
+    def _pick_fastest_rpc(self) -> str:
+        """Гонка eth_blockNumber по всем нодам: первая ответившая - самая быстрая"""
+        executor = ThreadPoolExecutor(max_workers=len(RPC_URLS))
+        try:
+            futures = [executor.submit(self._ping_rpc, url) for url in RPC_URLS]
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except Exception:
+                    continue
+            return POLYGON_RPC_URL
+        finally:
+            executor.shutdown(wait=False)
+
+    def _maybe_reelect_rpc(self):
+        """Раз в HEALTHCHECK_INTERVAL перепроверяем, какая нода сейчас быстрее"""
+        if time.time() - self._last_rpc_check < HEALTHCHECK_INTERVAL:
+            return
+        with self._rpc_lock:
+            if time.time() - self._last_rpc_check < HEALTHCHECK_INTERVAL:
+                return
+            self._last_rpc_check = time.time()
+            url = self._pick_fastest_rpc()
+            if url != self._rpc_url:
+                print(f"Switching RPC to {url}")
+                self._rpc_url = url
+                self._connect(url)
 
-    def _is_cache_valid(self) -> bool:
-        return time.time() - self._last_cache_update < self._cache_lifetime
+    def _rotate_rpc(self):
+        """Переключение на следующую ноду после ошибки RPC"""
+        with self._rpc_lock:
+            idx = RPC_URLS.index(self._rpc_url) if self._rpc_url in RPC_URLS else 0
+            self._rpc_url = RPC_URLS[(idx + 1) % len(RPC_URLS)]
+            print(f"RPC error, rotating to {self._rpc_url}")
+            self._connect(self._rpc_url)
 
-    def _update_cache_timestamp(self):
-        self._last_cache_update = time.time()
+    def _cache_get_balance(self, address: str) -> Union[int, None]:
+        if self._redis is not None:
+            try:
+                value = self._redis.get(f"bal:{address}")
+                return int(value) if value is not None else None
+            except Exception as e:
+                print(f"Redis error reading balance for {address}: {e}")
+                return None
+        with self._cache_lock:
+            return self._balance_cache.get(address)
+
+    def _cache_set_balance(self, address: str, balance: int):
+        if self._redis is not None:
+            try:
+                self._redis.set(f"bal:{address}", balance, ex=CACHE_LIFETIME)
+            except Exception as e:
+                print(f"Redis error writing balance for {address}: {e}")
+            return
+        with self._cache_lock:
+            self._balance_cache[address] = balance
+
+    def _cache_get_balances(self, addresses: List[str]) -> Dict[str, int]:
+        """Чтение пачки балансов одним MGET (или из локального словаря)"""
+        if self._redis is not None:
+            try:
+                values = self._redis.mget([f"bal:{addr}" for addr in addresses])
+                return {
+                    addr: int(value)
+                    for addr, value in zip(addresses, values)
+                    if value is not None
+                }
+            except Exception as e:
+                print(f"Redis error reading balance batch: {e}")
+                return {}
+        with self._cache_lock:
+            result = {}
+            for addr in addresses:
+                balance = self._balance_cache.get(addr)
+                if balance is not None:
+                    result[addr] = balance
+            return result
+
+    def _cache_set_balances(self, balances: Dict[str, int]):
+        if self._redis is not None:
+            try:
+                pipe = self._redis.pipeline()
+                for address, balance in balances.items():
+                    pipe.set(f"bal:{address}", balance, ex=CACHE_LIFETIME)
+                pipe.execute()
+            except Exception as e:
+                print(f"Redis error writing balance batch: {e}")
+            return
+        with self._cache_lock:
+            for address, balance in balances.items():
+                self._balance_cache[address] = balance
+
+    def _cache_get_transactions(self) -> Union[List[dict], None]:
+        if self._redis is not None:
+            try:
+                payload = self._redis.get("tx:tokentx")
+                if payload is not None:
+                    return _json_loads(gzip.decompress(payload))
+            except Exception as e:
+                print(f"Redis error reading transactions: {e}")
+            return None
+        if self._tx_cache and self._tx_cache[1] > time.time():
+            return self._tx_cache[0]
+        return None
+
+    def _cache_set_transactions(self, transactions: List[dict], ttl: int = CACHE_LIFETIME):
+        if self._redis is not None:
+            try:
+                payload = gzip.compress(_json_dumps_bytes(transactions))
+                self._redis.set("tx:tokentx", payload, ex=ttl)
+            except Exception as e:
+                print(f"Redis error writing transactions: {e}")
+            return
+        self._tx_cache = (transactions, time.time() + ttl)
+
+    @staticmethod
+    def _max_block(transactions: List[dict]) -> int:
+        return max((int(tx['blockNumber']) for tx in transactions), default=0)
 
     def format_balance(self, balance: int) -> float:
-        return balance / (10 ** self.decimals)
+        return balance / self._scale
+
+    def _get_balance_raw(self, address: str) -> int:
+        """Баланс в минимальных единицах токена; кэш хранит целые без потери точности"""
+        cached = self._cache_get_balance(address)
+        if cached is not None:
+            return cached
+
+        # При одновременном промахе адрес запрашивает только один поток,
+        # остальные ждут и читают заполненный им кэш
+        with self._inflight_lock:
+            event = self._inflight.get(address)
+            is_owner = event is None
+            if is_owner:
+                event = threading.Event()
+                self._inflight[address] = event
+
+        if not is_owner:
+            event.wait(REQUEST_TIMEOUT)
+            cached = self._cache_get_balance(address)
+            if cached is not None:
+                return cached
+            # Владелец не заполнил кэш (ошибка RPC) - запрашиваем сами
+            return self._fetch_balance_raw(address)
 
-    def get_balance(self, address: str) -> float:
-        address = self.w3.to_checksum_address(address)
-        if self._is_cache_valid() and address in self._balance_cache:
-            return self._balance_cache[address]
-            
         try:
-            balance = self.contract.functions.balanceOf(address).call()
-            formatted_balance = self.format_balance(balance)
-            self._balance_cache[address] = formatted_balance
-            self._update_cache_timestamp()
-            return formatted_balance
+            return self._fetch_balance_raw(address)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(address, None)
+            event.set()
+
+    def _fetch_balance_raw(self, address: str) -> int:
+        try:
+            raw = self.w3.eth.call({
+                'to': self.contract.address,
+                'data': _balance_of_calldata(address)
+            })
+            balance = abi_decode(['uint256'], bytes(raw))[0]
+            self._cache_set_balance(address, balance)
+            return balance
         except Exception as e:
             print(f"Error getting balance for {address}: {e}")
+            self._rotate_rpc()
             return 0
 
+    def get_balance(self, address: str) -> float:
+        return self.format_balance(self._get_balance_raw(_to_checksum(address)))
+
+    def _get_balances_multicall(self, addresses: List[str]) -> List[int]:
+        """Получение балансов пачкой через Multicall3: один eth_call на чанк вместо N"""
+        balances = []
+        for start in range(0, len(addresses), MULTICALL_CHUNK_SIZE):
+            chunk = addresses[start:start + MULTICALL_CHUNK_SIZE]
+            calls = [
+                (self.contract.address, False, _balance_of_calldata(address))
+                for address in chunk
+            ]
+            results = self.multicall.functions.aggregate3(calls).call()
+            for _, return_data in results:
+                balances.append(abi_decode(['uint256'], return_data)[0])
+        return balances
+
+    def _get_balances_jsonrpc_batch(self, addresses: List[str]) -> List[int]:
+        """Получение балансов через JSON-RPC batch: один HTTP POST на MAX_BATCH_SIZE вызовов"""
+        balances = []
+        for start in range(0, len(addresses), MAX_BATCH_SIZE):
+            chunk = addresses[start:start + MAX_BATCH_SIZE]
+            with self.w3.batch_requests() as batch:
+                for address in chunk:
+                    batch.add(self.w3.eth.call({
+                        'to': self.contract.address,
+                        'data': _balance_of_calldata(address)
+                    }))
+                results = batch.execute()
+            for result in results:
+                if not isinstance(result, (bytes, bytearray)):
+                    raise ValueError(f"Unexpected batch response: {result!r}")
+                balances.append(abi_decode(['uint256'], bytes(result))[0])
+        return balances
+
+    def _fetch_balances(self, addresses: List[str]) -> Dict[str, int]:
+        """Получение балансов: Multicall3 -> JSON-RPC batch -> по одному вызову"""
+        self._maybe_reelect_rpc()
+        raw_balances = None
+        try:
+            raw_balances = self._get_balances_multicall(addresses)
+        except Exception as e:
+            print(f"Error in multicall balance fetch, falling back to batch: {e}")
+            try:
+                raw_balances = self._get_balances_jsonrpc_batch(addresses)
+            except Exception as e:
+                print(f"Error in JSON-RPC batch balance fetch, falling back to per-call: {e}")
+
+        if raw_balances is not None:
+            balances = dict(zip(addresses, raw_balances))
+            self._cache_set_balances(balances)
+            return balances
+
+        # Параллельный обход: каждый вызов ждёт в основном сеть, GIL не мешает
+        workers = min(MAX_CONCURRENCY, len(addresses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(addresses, executor.map(self._get_balance_raw, addresses)))
+
     def get_balance_batch(self, addresses: List[str]) -> List[float]:
-        return [self.get_balance(addr) for addr in addresses]
+        addresses = [_to_checksum(addr) for addr in addresses]
+        unique = list(dict.fromkeys(addresses))
+        balances = self._cache_get_balances(unique)
+        missing = [addr for addr in unique if addr not in balances]
+        if missing:
+            balances.update(self._fetch_balances(missing))
+        # Деление на 10**decimals делаем один раз, на выходе из публичного метода
+        return [self.format_balance(balances.get(addr, 0)) for addr in addresses]
 
     def _get_token_transactions(self) -> List[dict]:
-        if self._is_cache_valid() and self._tx_cache:
-            return self._tx_cache
-            
+        cached = self._cache_get_transactions()
+        if cached:
+            return cached
+        # Обновлением занимается один поток, остальные дожидаются и читают кэш
+        with self._tx_lock:
+            cached = self._cache_get_transactions()
+            if cached:
+                return cached
+            return self._refresh_token_transactions()
+
+    def _refresh_token_transactions(self) -> List[dict]:
         ETHERSCAN_API = "https://api.etherscan.io/v2/api"
         params = {
             'chainid': '137',
@@ -105,15 +510,71 @@ class TokenTracker:
             'sort': 'desc',
             'apikey': API_KEY
         }
-        
+
+        # Если история уже накоплена, дозапрашиваем только блоки новее закэшированных;
+        # полный ответ на 1000 строк скачиваем не чаще раза в час
+        now = time.time()
+        incremental = (
+            self._tx_last_good
+            and now - self._tx_last_full_refresh < TX_FULL_REFRESH_INTERVAL
+        )
+        if incremental:
+            params['startblock'] = str(self._tx_high_water[1] + 1)
+            params['sort'] = 'asc'
+
+
         try:
-            response = requests.get(ETHERSCAN_API, params=params)
-            data = response.json()
-            
+            for attempt in range(3):
+                _etherscan_limiter.acquire()
+                response = self._session.get(ETHERSCAN_API, params=params, timeout=REQUEST_TIMEOUT)
+                data = _json_loads(response.content)
+                rate_limited = (
+                    response.status_code == 429
+                    or (data.get('status') == '0'
+                        and 'rate limit' in str(data.get('result', '')).lower())
+                )
+                if not rate_limited:
+                    break
+                # Экспоненциальная пауза с джиттером, чтобы потоки не бились в лимит синхронно
+                time.sleep(2 ** attempt + random.uniform(0, 0.5))
+
+            if incremental and data.get('message') == 'No transactions found':
+                # Новых блоков нет - продлеваем жизнь накопленной истории
+                self._cache_set_transactions(self._tx_last_good)
+                return self._tx_last_good
+
             if data['status'] == '1' and 'result' in data:
-                self._tx_cache = data['result']
-                self._update_cache_timestamp()
-                return self._tx_cache
+                new_txs = data['result']
+
+                if incremental:
+                    new_txs.sort(key=lambda tx: int(tx['blockNumber']), reverse=True)
+                    merged = (new_txs + self._tx_last_good)[:TX_WINDOW]
+                    count, _ = self._tx_high_water
+                    self._tx_high_water = (count, self._max_block(merged))
+                    self._tx_last_good = merged
+                    self._cache_set_transactions(merged)
+                    return merged
+
+                count, max_block = self._tx_high_water
+                new_max_block = self._max_block(new_txs)
+                # Условная замена: не даём урезанному ответу вытеснить более полный кэш
+                if self._tx_last_good and (len(new_txs) < count or new_max_block < max_block):
+                    print(
+                        f"Degraded transactions payload ({len(new_txs)} rows, block {new_max_block}), "
+                        f"keeping cached copy ({count} rows, block {max_block})"
+                    )
+                    self._cache_set_transactions(self._tx_last_good)
+                    return self._tx_last_good
+                self._tx_high_water = (len(new_txs), new_max_block)
+                self._tx_last_good = new_txs
+                self._tx_last_full_refresh = now
+                self._cache_set_transactions(new_txs)
+                return new_txs
+
+            # Короткий отрицательный TTL: после отказа не долбим Etherscan каждым запросом
+            if self._tx_last_good:
+                self._cache_set_transactions(self._tx_last_good, ttl=NEGATIVE_CACHE_LIFETIME)
+                return self._tx_last_good
             return []
         except Exception as e:
             print(f"Error getting transactions: {e}")
@@ -126,58 +587,60 @@ class TokenTracker:
             
         addresses = set()
         for tx in transactions:
-            addresses.add(tx['from'])
-            addresses.add(tx['to'])
-        
-        holders = []
-        for address in addresses:
-            if address != "0x0000000000000000000000000000000000000000":
-                try:
-                    balance = self.get_balance(address)
-                    if balance > 0:
-                        holders.append((address, balance))
-                except Exception as e:
-                    print(f"Error getting balance for {address}: {e}")
-                    continue
-        
-        return sorted(holders, key=lambda x: x[1], reverse=True)[:n]
+            addresses.add(_to_checksum(tx['from']))
+            addresses.add(_to_checksum(tx['to']))
+        addresses.discard(ZERO_ADDRESS)
+        addresses = list(addresses)
+
+        balances = self.get_balance_batch(addresses)
+        holders = [
+            (address, balance)
+            for address, balance in zip(addresses, balances)
+            if balance > 0
+        ]
+
+        return _top_n_by_balance(holders, n)
 
     def get_top_with_transactions(self, n: int) -> List[Tuple[str, float, str]]:
         transactions = self._get_token_transactions()
         if not transactions:
             return []
             
-        holders_data = {}
-        
+        # Транзакции отсортированы по убыванию, первое вхождение адреса - его последняя транзакция
+        last_tx = {}
         for tx in transactions:
-            for address in [tx['to'], tx['from']]:
-                if address not in holders_data and address != "0x0000000000000000000000000000000000000000":
-                    try:
-                        balance = self.get_balance(address)
-                        if balance > 0:
-                            timestamp = datetime.fromtimestamp(int(tx['timeStamp']))
-                            holders_data[address] = {
-                                'balance': balance,
-                                'last_tx': timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                            }
-                    except Exception as e:
-                        print(f"Error getting balance for {address}: {e}")
-                        continue
-        
-        sorted_holders = sorted(
-            [(addr, data['balance'], data['last_tx']) 
-             for addr, data in holders_data.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )[:n]
-        
-        return sorted_holders
+            for address in (tx['to'], tx['from']):
+                address = _to_checksum(address)
+                if address == ZERO_ADDRESS or address in last_tx:
+                    continue
+                timestamp = datetime.fromtimestamp(int(tx['timeStamp']))
+                last_tx[address] = timestamp.strftime('%Y-%m-%d %H:%M:%S')
+
+        addresses = list(last_tx)
+        balances = self.get_balance_batch(addresses)
+        holders = [
+            (address, balance, last_tx[address])
+            for address, balance in zip(addresses, balances)
+            if balance > 0
+        ]
+
+        return _top_n_by_balance(holders, n)
 
     def get_token_info(self) -> Dict[str, Union[str, int]]:
         try:
-            if self._is_cache_valid() and self._token_info_cache:
-                return self._token_info_cache
+            if self._token_info_cache and self._token_info_cache[1] > time.time():
+                return self._token_info_cache[0]
+
+            with self._info_lock:
+                if self._token_info_cache and self._token_info_cache[1] > time.time():
+                    return self._token_info_cache[0]
+                return self._fetch_token_info()
+        except Exception as e:
+            print(f"Error getting token info: {e}")
+            return {}
 
+    def _fetch_token_info(self) -> Dict[str, Union[str, int]]:
+        try:
             symbol = self.contract.functions.symbol().call()
             name = self.contract.functions.name().call()
             total_supply = self.contract.functions.totalSupply().call()
@@ -188,8 +651,7 @@ class TokenTracker:
                 "totalSupply": self.format_balance(total_supply)
             }
 
-            self._token_info_cache = info
-            self._update_cache_timestamp()
+            self._token_info_cache = (info, time.time() + CACHE_LIFETIME)
             return info
         except Exception as e:
             print(f"Error getting token info: {e}")
@@ -218,29 +680,42 @@ class TokenTracker:
         """Получение истории транзакций для адреса"""
         try:
             transactions = self._get_token_transactions()
-            address = self.w3.to_checksum_address(address)
-            
+            addr_lc = _to_checksum(address).lower()
+
             address_txs = []
             for tx in transactions:
-                if tx['to'].lower() == address.lower() or tx['from'].lower() == address.lower():
-                    timestamp = datetime.fromtimestamp(int(tx['timeStamp']))
-                    address_txs.append({
-                        'type': 'receive' if tx['to'].lower() == address.lower() else 'send',
-                        'counterparty': tx['from'] if tx['to'].lower() == address.lower() else tx['to'],
-                        'amount': self.format_balance(int(tx['value'])),
-                        'timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                    })
-                    
+                to_lc = tx['to'].lower()
+                from_lc = tx['from'].lower()
+                if to_lc != addr_lc and from_lc != addr_lc:
+                    continue
+                is_receive = to_lc == addr_lc
+                timestamp = datetime.fromtimestamp(int(tx['timeStamp']))
+                address_txs.append({
+                    'type': 'receive' if is_receive else 'send',
+                    'counterparty': tx['from'] if is_receive else tx['to'],
+                    'amount': self.format_balance(int(tx['value'])),
+                    'timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S')
+                })
                 if len(address_txs) >= limit:
                     break
-                    
+
             return address_txs
         except Exception as e:
             print(f"Error getting address history: {e}")
             return []
 
+class OrjsonProvider(JSONProvider):
+    """Сериализация ответов через orjson (~5x быстрее stdlib json)"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Инициализация Flask приложения
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 tracker = TokenTracker()
 
 @app.route('/api/docs')
@@ -290,37 +765,37 @@ def api_documentation():
     })
 
 @app.route('/get_balance', methods=['GET'])
-def api_get_balance():
+async def api_get_balance():
     address = request.args.get('address')
     if not address:
         return jsonify({"error": "Address parameter is required"}), 400
-    
+
     try:
-        balance = tracker.get_balance(address)
+        balance = await asyncio.to_thread(tracker.get_balance, address)
         return jsonify({"balance": balance})
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
 @app.route('/get_balance_batch', methods=['POST'])
-def api_get_balance_batch():
+async def api_get_balance_batch():
     data = request.get_json()
     if not data or 'addresses' not in data:
         return jsonify({"error": "Addresses are required in request body"}), 400
-    
+
     try:
-        balances = tracker.get_balance_batch(data['addresses'])
+        balances = await asyncio.to_thread(tracker.get_balance_batch, data['addresses'])
         return jsonify({"balances": balances})
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
 @app.route('/get_top', methods=['GET'])
-def api_get_top():
+async def api_get_top():
     try:
         n = request.args.get('n', default=10, type=int)
         if n <= 0:
             return jsonify({"error": "Parameter 'n' must be positive"}), 400
-        
-        top_holders = tracker.get_top_holders(n)
+
+        top_holders = await asyncio.to_thread(tracker.get_top_holders, n)
         return jsonify({
             "top_holders": [
                 {"address": address, "balance": balance}
@@ -331,13 +806,13 @@ def api_get_top():
         return jsonify({"error": str(e)}), 400
 
 @app.route('/get_top_with_transactions', methods=['GET'])
-def api_get_top_with_transactions():
+async def api_get_top_with_transactions():
     try:
         n = request.args.get('n', default=10, type=int)
         if n <= 0:
             return jsonify({"error": "Parameter 'n' must be positive"}), 400
-        
-        top_holders = tracker.get_top_with_transactions(n)
+
+        top_holders = await asyncio.to_thread(tracker.get_top_with_transactions, n)
         return jsonify({
             "holders": [
                 {
@@ -352,33 +827,33 @@ def api_get_top_with_transactions():
         return jsonify({"error": str(e)}), 400
 
 @app.route('/token_info', methods=['GET'])
-def api_token_info():
+async def api_token_info():
     try:
-        info = tracker.get_token_info()
+        info = await asyncio.to_thread(tracker.get_token_info)
         return jsonify(info)
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
 @app.route('/token_stats')
-def api_token_stats():
+async def api_token_stats():
     """Get extended token statistics"""
     try:
-        stats = tracker.get_token_stats()
+        stats = await asyncio.to_thread(tracker.get_token_stats)
         return jsonify(stats)
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
 @app.route('/address_history')
-def api_address_history():
+async def api_address_history():
     """Get transaction history for an address"""
     address = request.args.get('address')
     limit = request.args.get('limit', default=100, type=int)
-    
+
     if not address:
         return jsonify({"error": "Address parameter is required"}), 400
-        
+
     try:
-        history = tracker.get_address_history(address, limit)
+        history = await asyncio.to_thread(tracker.get_address_history, address, limit)
         return jsonify({
             "address": address,
             "transactions": history
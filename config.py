@@ -9,11 +9,18 @@ ALTERNATIVE_RPC_URLS = [
 CONTRACT_ADDRESS = "0x1a9b54a3075119f1546c52ca0940551a6ce5d2d0"
 API_KEY = "......"
 
+# Cache Configuration
+REDIS_URL = None  # e.g. "redis://localhost:6379/0"; in-process cache is used when unset
+MAX_CACHE_SIZE = 10_000  # Maximum number of entries in the in-process balance cache
+
 # API Configuration
 API_RATE_LIMIT = 5  # requests per second
 CACHE_LIFETIME = 300  # 5 minutes in seconds
-MAX_BATCH_SIZE = 20  # Maximum number of addresses in batch request
+NEGATIVE_CACHE_LIFETIME = 30  # seconds to keep serving cached data after an Etherscan failure
+MAX_BATCH_SIZE = 100  # Maximum number of eth_calls per JSON-RPC batch request
+MAX_CONCURRENCY = 30  # Worker threads for the per-call balance fallback
 REQUEST_TIMEOUT = 30  # seconds
+HEALTHCHECK_INTERVAL = 60  # seconds between RPC fastest-node re-elections
 
 # Server Configuration
 HOST = "0.0.0.0"
@@ -1,7 +1,8 @@
+import time
 import unittest
 from unittest.mock import Mock, patch
 from datetime import datetime
-from bot import TokenTracker, app
+from bot import RateLimiter, TokenTracker, app, _top_n_by_balance
 
 class TestTokenTracker(unittest.TestCase):
     def setUp(self):
@@ -34,6 +35,28 @@ class TestTokenTracker(unittest.TestCase):
         self.assertIn('name', info)
         self.assertIn('totalSupply', info)
 
+class TestTopNByBalance(unittest.TestCase):
+    def test_returns_largest_first(self):
+        holders = [("0xa", 1.0), ("0xb", 5.0), ("0xc", 3.0), ("0xd", 2.0)]
+        self.assertEqual(
+            _top_n_by_balance(holders, 2),
+            [("0xb", 5.0), ("0xc", 3.0)]
+        )
+
+    def test_n_larger_than_rows(self):
+        holders = [("0xa", 1.0), ("0xb", 2.0)]
+        self.assertEqual(len(_top_n_by_balance(holders, 10)), 2)
+
+class TestRateLimiter(unittest.TestCase):
+    def test_spaces_out_calls(self):
+        limiter = RateLimiter(rate=50)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+        # Первый вызов проходит сразу, остальные четыре выдерживают интервал
+        self.assertGreaterEqual(elapsed, 4 * (1 / 50))
+
 class TestAPI(unittest.TestCase):
     def setUp(self):
         app.testing = True